@@ -0,0 +1,221 @@
+""" Numba compiled proof-of-work search, used by the challenge solver when \
+    numba is installed. """
+
+# the compiled functions release the GIL (`nogil=True`), so several Python
+# threads can search disjoint strides of nonces truly in parallel.
+
+import threading
+from typing import Optional
+
+import numpy as np
+from numba import njit
+
+BATCH_SIZE = 1 << 16
+"""Number of nonces searched per compiled call between stop checks."""
+
+_MASK = 0xFFFFFFFF
+
+# fmt: off
+_K = np.array(
+    [
+        0x428A2F98, 0x71374491, 0xB5C0FBCF, 0xE9B5DBA5,
+        0x3956C25B, 0x59F111F1, 0x923F82A4, 0xAB1C5ED5,
+        0xD807AA98, 0x12835B01, 0x243185BE, 0x550C7DC3,
+        0x72BE5D74, 0x80DEB1FE, 0x9BDC06A7, 0xC19BF174,
+        0xE49B69C1, 0xEFBE4786, 0x0FC19DC6, 0x240CA1CC,
+        0x2DE92C6F, 0x4A7484AA, 0x5CB0A9DC, 0x76F988DA,
+        0x983E5152, 0xA831C66D, 0xB00327C8, 0xBF597FC7,
+        0xC6E00BF3, 0xD5A79147, 0x06CA6351, 0x14292967,
+        0x27B70A85, 0x2E1B2138, 0x4D2C6DFC, 0x53380D13,
+        0x650A7354, 0x766A0ABB, 0x81C2C92E, 0x92722C85,
+        0xA2BFE8A1, 0xA81A664B, 0xC24B8B70, 0xC76C51A3,
+        0xD192E819, 0xD6990624, 0xF40E3585, 0x106AA070,
+        0x19A4C116, 0x1E376C08, 0x2748774C, 0x34B0BCB5,
+        0x391C0CB3, 0x4ED8AA4A, 0x5B9CCA4F, 0x682E6FF3,
+        0x748F82EE, 0x78A5636F, 0x84C87814, 0x8CC70208,
+        0x90BEFFFA, 0xA4506CEB, 0xBEF9A3F7, 0xC67178F2,
+    ],
+    dtype=np.int64,
+)
+
+_H0 = np.array(
+    [
+        0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A,
+        0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19,
+    ],
+    dtype=np.int64,
+)
+# fmt: on
+
+
+@njit(nogil=True, cache=True)
+def _rotr(x, n):  # pragma: no cover
+    return ((x >> n) | (x << (32 - n))) & _MASK
+
+
+@njit(nogil=True, cache=True)
+def _sha256_block(state, block, offset, w):  # pragma: no cover
+    # pylint: disable=too-many-locals
+    """Run the SHA-256 compression of the 64 bytes of `block` starting at \
+        `offset` on `state` in place, `w` is a scratch array of 64 words."""
+    for i in range(16):
+        j = offset + 4 * i
+        w[i] = (
+            (np.int64(block[j]) << 24)
+            | (np.int64(block[j + 1]) << 16)
+            | (np.int64(block[j + 2]) << 8)
+            | np.int64(block[j + 3])
+        )
+    for i in range(16, 64):
+        w15 = w[i - 15]
+        w2 = w[i - 2]
+        s0 = _rotr(w15, 7) ^ _rotr(w15, 18) ^ (w15 >> 3)
+        s1 = _rotr(w2, 17) ^ _rotr(w2, 19) ^ (w2 >> 10)
+        w[i] = (w[i - 16] + s0 + w[i - 7] + s1) & _MASK
+
+    a, b, c, d = state[0], state[1], state[2], state[3]
+    e, f, g, h = state[4], state[5], state[6], state[7]
+    for i in range(64):
+        s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+        ch = (e & f) ^ (~e & _MASK & g)
+        temp1 = (h + s1 + ch + _K[i] + w[i]) & _MASK
+        s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+        maj = (a & b) ^ (a & c) ^ (b & c)
+        temp2 = (s0 + maj) & _MASK
+        h = g
+        g = f
+        f = e
+        e = (d + temp1) & _MASK
+        d = c
+        c = b
+        b = a
+        a = (temp1 + temp2) & _MASK
+
+    state[0] = (state[0] + a) & _MASK
+    state[1] = (state[1] + b) & _MASK
+    state[2] = (state[2] + c) & _MASK
+    state[3] = (state[3] + d) & _MASK
+    state[4] = (state[4] + e) & _MASK
+    state[5] = (state[5] + f) & _MASK
+    state[6] = (state[6] + g) & _MASK
+    state[7] = (state[7] + h) & _MASK
+
+
+@njit(nogil=True, cache=True)
+def _midstate(prefix, num_blocks):  # pragma: no cover
+    """Return the hash state after absorbing the first `num_blocks` full \
+        blocks of `prefix`."""
+    state = _H0.copy()
+    w = np.empty(64, dtype=np.int64)
+    for i in range(num_blocks):
+        _sha256_block(state, prefix, 64 * i, w)
+    return state
+
+
+@njit(nogil=True, cache=True)
+def _search(  # pylint: disable=too-many-arguments,too-many-locals
+    midstate, tail, prefix_len, target, start, step, count
+):  # pragma: no cover
+    """Search `count` nonces from `start` in strides of `step` and return \
+        the first valid one, or -1 if none of them is valid."""
+    tail_len = tail.shape[0]
+    block = np.zeros(128, dtype=np.uint8)
+    block[:tail_len] = tail
+    digits = np.empty(20, dtype=np.uint8)
+    state = np.empty(8, dtype=np.int64)
+    w = np.empty(64, dtype=np.int64)
+
+    nonce = start
+    for _ in range(count):
+        # ascii decimal digits of the nonce, least significant first
+        num_digits = 0
+        value = nonce
+        while True:
+            digits[num_digits] = 48 + value % 10
+            num_digits += 1
+            value //= 10
+            if value == 0:
+                break
+
+        msg_len = tail_len + num_digits
+        for i in range(num_digits):
+            block[tail_len + i] = digits[num_digits - 1 - i]
+        block[msg_len] = 0x80
+        end = 64 if msg_len + 9 <= 64 else 128
+        block[msg_len + 1:end - 8] = 0
+        bit_len = (prefix_len + num_digits) * 8
+        for i in range(8):
+            block[end - 1 - i] = (bit_len >> (8 * i)) & 0xFF
+
+        state[:] = midstate
+        _sha256_block(state, block, 0, w)
+        if end == 128:
+            _sha256_block(state, block, 64, w)
+
+        # lexicographic `digest < target` on big-endian words
+        for i in range(8):
+            if state[i] != target[i]:
+                if state[i] < target[i]:
+                    return nonce
+                break
+        nonce += step
+
+    return -1
+
+
+def find_nonce_nb(
+    prefix_bytes: bytes,
+    target: bytes,
+    start: int = 0,
+    step: int = 1,
+    stop_event: "Optional[threading.Event]" = None,
+) -> Optional[int]:
+    """Find a nonce such that ``sha256(prefix_bytes + nonce) < target``.
+
+    Searches the nonces ``start, start + step, ...``.
+
+    Parameters
+    ----------
+    prefix_bytes : bytes
+        The encoded prefix of the challenge.
+    target : bytes
+        The 32 bytes target hash.
+    start : int
+        The first nonce to try.
+    step : int
+        The distance between two tried nonces.
+    stop_event : threading.Event, optional
+        Checked every :data:`BATCH_SIZE` nonces, the search gives up once \
+            it is set.
+
+    Returns
+    -------
+    nonce : int or None
+        The first valid nonce, or None if `stop_event` was set.
+    """
+    if len(target) != 32:
+        raise ValueError("target must be a 32 bytes SHA-256 digest")
+
+    prefix = np.frombuffer(prefix_bytes, dtype=np.uint8)
+    num_blocks = len(prefix_bytes) // 64
+    midstate = _midstate(prefix, num_blocks)
+    tail = prefix[64 * num_blocks:].copy()
+    target_words = np.frombuffer(target, dtype=">u4").astype(np.int64)
+
+    nonce = start
+    while stop_event is None or not stop_event.is_set():
+        found = _search(
+            midstate,
+            tail,
+            len(prefix_bytes),
+            target_words,
+            nonce,
+            step,
+            BATCH_SIZE,
+        )
+        if found >= 0:
+            if stop_event is not None:
+                stop_event.set()
+            return int(found)
+        nonce += step * BATCH_SIZE
+    return None
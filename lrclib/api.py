@@ -1,21 +1,51 @@
 """ API for lrclib"""
 
+import copy
+import json
 import os
+import sys
 import warnings
-from http import HTTPStatus
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads  # type: ignore
 
+from .cache import LRUCache
 from .cryptographic_challenge_solver import CryptoChallengeSolver
 from .exceptions import (
     APIError,
-    IncorrectPublishTokenError,
     NotFoundError,
-    RateLimitError,
-    ServerError,
+    Response,
+    error_from_response,
+)
+from .models import (
+    CryptographicChallenge,
+    Lyrics,
+    LyricsMinimal,
+    SearchResult,
 )
-from .models import CryptographicChallenge, Lyrics, SearchResult
 
 BASE_URL = "https://lrclib.net/api"
 ENDPOINTS: Dict[str, str] = {
@@ -26,43 +56,206 @@ ENDPOINTS: Dict[str, str] = {
     "publish": "/publish",
     "request_challenge": "/request-challenge",
 }
+POOL_SIZE = 32
+"""Number of pooled keep-alive connections of the default session."""
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)
+"""Retry policy of the default session for transient gateway errors, only \
+GET is retried since a gateway error on POST /publish may arrive after \
+the lyrics were published with the single-use token."""
+CACHE_SIZE = 4096
+"""Default number of responses kept in the in-memory cache."""
+CACHE_EXPIRE_AFTER = timedelta(days=30)
+"""How long responses are kept in the on-disk cache, unless the server's \
+cache headers say otherwise."""
+
+
+def _http_errors() -> Tuple[Type[Exception], ...]:
+    """Exceptions raised by ``raise_for_status`` of a requests session or, \
+    once httpx has been imported, of an httpx client."""
+    # httpx is only imported for an http2 or user provided httpx client
+    httpx_module = sys.modules.get("httpx")
+    if httpx_module is None:
+        return (requests.exceptions.HTTPError,)
+    return (requests.exceptions.HTTPError, httpx_module.HTTPStatusError)
+
+
+def _json(response: Response) -> Any:
+    """Decode the JSON body of `response`, with orjson if it is installed, \
+    a malformed body raises ``requests.JSONDecodeError`` either way, like \
+    ``requests.Response.json``."""
+    try:
+        return _json_loads(response.content)
+    except json.JSONDecodeError as exc:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        raise requests.JSONDecodeError(exc.msg, exc.doc, exc.pos) from exc
+
+
+def _search_params(
+    query: "str | None",
+    track_name: "str | None",
+    artist_name: "str | None",
+    album_name: "str | None",
+) -> Dict[str, str]:
+    """Build the query parameters of a search request."""
+    # either query or track_name is required
+    if not query and not track_name:
+        raise ValueError(
+            "Either query or track_name is required to search lyrics"
+        )
+
+    params = {
+        "q": query,
+        "track_name": track_name,
+        "artist_name": artist_name,
+        "album_name": album_name,
+    }
+    return {k: v for k, v in params.items() if v is not None}
+
+
+def _create_session(cache_path: "str | None" = None) -> requests.Session:
+    """Create a requests session with a pooled, retrying adapter, backed by \
+    an on-disk cache at `cache_path` if given."""
+    if cache_path is None:
+        session = requests.Session()
+    else:
+        # imported here, requests-cache takes about 80 ms to import
+        try:
+            import requests_cache  # pylint: disable=import-outside-toplevel
+        except ImportError as exc:
+            raise ImportError(
+                "Caching requires requests-cache, install it with"
+                " `pip install lrclibapi[cache]`"
+            ) from exc
+
+        # only GET is cached, POST /publish and /request-challenge never are
+        session = requests_cache.CachedSession(
+            cache_name=cache_path,
+            backend="sqlite",
+            expire_after=CACHE_EXPIRE_AFTER,
+            allowable_methods=("GET",),
+            cache_control=True,
+        )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=RETRY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _create_http2_client() -> "httpx.Client":
+    """Create an httpx client with HTTP/2 enabled."""
+    # imported here, httpx takes about 30 ms to import
+    try:
+        import httpx  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "HTTP/2 requires httpx, install it with"
+            " `pip install lrclibapi[http2]`"
+        ) from exc
+
+    # follow redirects like a requests session does
+    return httpx.Client(
+        http2=True,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=POOL_SIZE,
+            max_keepalive_connections=POOL_SIZE,
+        ),
+    )
 
 
 class LrcLibAPI:
     """
     Create a new LrcLibAPI instance. You can optionally pass a custom \
-        base URL and a custom requests session.
+        base URL and a custom requests session or httpx client.
 
     .. note::
         setting `user_agent` is not required, but it is recommended by LRCLIB.
 
+    .. note::
+        cached results are shared between calls, copy them before mutating.
+
     Parameters
     ----------
     user_agent : str
         User agent to use for the requests
     base_url : str, optional
         Base URL to use for the requests
-    session : requests.Session, optional
-        Requests session to use for the requests
+    session : requests.Session | httpx.Client, optional
+        Session to use for the requests, if not provided, a new \
+            requests session with a pooled, retrying adapter is created
+    cache_size : int, optional
+        Number of lyrics and search results to keep in memory, repeated \
+            lookups are answered from this cache without a request. \
+            Defaults to 4096, set to 0 to disable caching.
+    http2 : bool, optional
+        Create an HTTP/2 httpx client instead of a requests session, so \
+            concurrent requests share one connection. Requires the \
+            `http2` extra: ``pip install lrclibapi[http2]``
+    cache_path : str, optional
+        Path of an SQLite database to cache GET responses on disk for 30 \
+            days or as long as the server's cache headers allow, so they \
+            survive restarts. Requires the `cache` extra: \
+            ``pip install lrclibapi[cache]``
+    use_numba : bool, optional
+        Solve the publish challenge with the numba compiled solver. \
+            Requires the `numba` extra: ``pip install lrclibapi[numba]``
 
     Raises
     ------
     UserWarning
         If user_agent is not set
+    ImportError
+        If `http2` or `cache_path` is set but the extra is not installed
+    ValueError
+        If both `http2` and `cache_path` are set, or if either of them is \
+            set together with `session`
 
     Examples
     --------
     See the :doc:`examples/fetch_lyrics` section for usage examples.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         user_agent: str,
         base_url: "str | None" = None,
-        session: "requests.Session | None" = None,
+        session: "requests.Session | httpx.Client | None" = None,
+        cache_size: int = CACHE_SIZE,
+        http2: bool = False,
+        cache_path: "str | None" = None,
+        use_numba: bool = False,
     ):
+        if http2 and cache_path is not None:
+            raise ValueError("cache_path is not supported with http2")
+        if session is not None and (http2 or cache_path is not None):
+            raise ValueError(
+                "http2 and cache_path create their own session, they cannot"
+                " be combined with `session`"
+            )
+
         self._base_url = base_url or BASE_URL
-        self.session = session or requests.Session()
+        self._urls = {
+            name: self._base_url + endpoint
+            for name, endpoint in ENDPOINTS.items()
+        }
+        self._get_by_id_url = self._urls["get_by_id"].format
+        self._cache: LRUCache[Any] = LRUCache(cache_size)
+        self._use_numba = use_numba
+        if session is None and http2:
+            session = _create_http2_client()
+        elif session is None:
+            session = _create_session(cache_path)
+        self.session: "requests.Session | httpx.Client" = session
 
         if not user_agent:
             warnings.warn(
@@ -76,25 +269,14 @@ class LrcLibAPI:
     def _make_request(
         self,
         method: str,
-        endpoint: str,
+        url: str,
         **kwargs: Any,
-    ) -> requests.Response:
-        url = self._base_url + endpoint
-
+    ) -> Response:
         try:
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
-        except requests.exceptions.HTTPError as exc:
-            response = exc.response  # type: ignore
-            if response.status_code == HTTPStatus.NOT_FOUND:
-                raise NotFoundError(response) from exc
-            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
-                raise RateLimitError(response) from exc
-            if response.status_code == HTTPStatus.BAD_REQUEST:
-                raise IncorrectPublishTokenError(response) from exc
-            if 500 <= response.status_code < 600:
-                raise ServerError(response) from exc
-            raise APIError(response) from exc
+        except _http_errors() as exc:
+            raise error_from_response(exc.response) from exc  # type: ignore
         return response
 
     def get_lyrics(  # pylint: disable=too-many-arguments
@@ -137,15 +319,63 @@ class LrcLibAPI:
             If the request fails
         """
 
-        endpoint = ENDPOINTS["get_cached" if cached else "get"]
+        cache_key = (
+            "get",
+            track_name,
+            artist_name,
+            album_name,
+            duration,
+            cached,
+        )
+        lyrics = self._cache.get(cache_key)
+        if lyrics is not None:
+            return copy.copy(lyrics)
+
+        url = self._urls["get_cached" if cached else "get"]
         params = {
             "track_name": track_name,
             "artist_name": artist_name,
             "album_name": album_name,
             "duration": duration,
         }
-        response = self._make_request("GET", endpoint, params=params)
-        return Lyrics.from_dict(response.json())
+        response = self._make_request("GET", url, params=params)
+        lyrics = Lyrics.from_dict(_json(response))
+        # cache a copy, callers may modify the returned objects
+        self._cache.set(cache_key, copy.copy(lyrics))
+        return lyrics
+
+    def get_lyrics_batch(
+        self,
+        queries: Iterable[Mapping[str, Any]],
+        max_workers: int = 16,
+    ) -> List["Lyrics | BaseException"]:
+        """
+        Get lyrics for many tracks concurrently from a thread pool sharing \
+            this instance's session.
+
+        .. note::
+            Keep `max_workers` at or below the session's connection pool \
+                size (32 for the default session) to reuse connections.
+
+        Parameters
+        ----------
+        queries : Iterable[Mapping[str, Any]]
+            Keyword arguments for :meth:`get_lyrics`, one mapping per track
+        max_workers : int, optional
+            Number of concurrent requests, defaults to 16
+
+        Returns
+        -------
+        List[Lyrics | BaseException]
+            Lyrics in the same order as `queries`, or the exception raised \
+                for that track, e.g. a NotFoundError, so one failure does \
+                not discard the whole batch
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.get_lyrics, **query) for query in queries
+            ]
+        return [future.exception() or future.result() for future in futures]
 
     def get_lyrics_by_id(self, lrclib_id: "str | int") -> Lyrics:
         """
@@ -167,9 +397,17 @@ class LrcLibAPI:
         APIError
             If the request fails
         """
-        endpoint = ENDPOINTS["get_by_id"].format(id=lrclib_id)
-        response = self._make_request("GET", endpoint)
-        return Lyrics.from_dict(response.json())
+        cache_key = ("get_by_id", str(lrclib_id))
+        lyrics = self._cache.get(cache_key)
+        if lyrics is not None:
+            return copy.copy(lyrics)
+
+        url = self._get_by_id_url(id=lrclib_id)
+        response = self._make_request("GET", url)
+        lyrics = Lyrics.from_dict(_json(response))
+        # cache a copy, callers may modify the returned objects
+        self._cache.set(cache_key, copy.copy(lyrics))
+        return lyrics
 
     def search_lyrics(
         self,
@@ -205,25 +443,73 @@ class LrcLibAPI:
         APIError
             If the request fails
         """
-        # either query or track_name is required
-        if not query and not track_name:
-            raise ValueError(
-                "Either query or track_name is required to search lyrics"
-            )
+        params = _search_params(query, track_name, artist_name, album_name)
+        cache_key = ("search", *params.items())
+        result = self._cache.get(cache_key)
+        if result is not None:
+            return SearchResult(result)
 
-        endpoint = ENDPOINTS["search"]
-        params = {
-            "q": query,
-            "track_name": track_name,
-            "artist_name": artist_name,
-            "album_name": album_name,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
         try:
-            response = self._make_request("GET", endpoint, params=params)
+            response = self._make_request(
+                "GET", self._urls["search"], params=params
+            )
         except NotFoundError:
             return SearchResult([])
-        return SearchResult.from_list(response.json())
+        result = SearchResult.from_list(_json(response))
+        self._cache.set(cache_key, SearchResult(result))
+        return result
+
+    def iter_search_results(  # pylint: disable=too-many-arguments
+        self,
+        query: "str | None" = None,
+        track_name: "str | None" = None,
+        artist_name: "str | None" = None,
+        album_name: "str | None" = None,
+        limit: "int | None" = None,
+    ) -> Iterator[LyricsMinimal]:
+        """
+        Search lyrics like :meth:`search_lyrics`, but build the \
+            :class:`LyricsMinimal` objects lazily, so callers that only \
+            need the first few matches skip building the rest.
+
+        .. note::
+            The request is sent when this method is called, the results \
+            are built while iterating.
+
+        Parameters
+        ----------
+        query : str, optional
+            Search query
+        track_name : str, optional
+            Track name
+        artist_name : str, optional
+            Artist name
+        album_name : str, optional
+            Album name
+        limit : int, optional
+            Maximum number of results to yield
+
+        Returns
+        -------
+        Iterator[LyricsMinimal]
+
+        Raises
+        ------
+        APIError
+            If the request fails
+        """
+        params = _search_params(query, track_name, artist_name, album_name)
+        cached = self._cache.get(("search", *params.items()))
+        if cached is not None:
+            return islice(cached, limit)
+
+        try:
+            response = self._make_request(
+                "GET", self._urls["search"], params=params
+            )
+        except NotFoundError:
+            return iter(())
+        return islice(map(LyricsMinimal.from_dict, _json(response)), limit)
 
     def request_challenge(self) -> CryptographicChallenge:
         """
@@ -251,12 +537,12 @@ class LrcLibAPI:
         APIError
             If the request fails
         """
-        endpoint = ENDPOINTS["request_challenge"]
+        url = self._urls["request_challenge"]
         try:
-            response = self._make_request("POST", endpoint)
+            response = self._make_request("POST", url)
         except APIError as exc:
             raise exc
-        return CryptographicChallenge.from_dict(response.json())
+        return CryptographicChallenge.from_dict(_json(response))
 
     def _obtain_publish_token(self) -> str:
         """
@@ -270,7 +556,10 @@ class LrcLibAPI:
         num_threads = os.cpu_count() or 1
         challenge = self.request_challenge()
         nonce = CryptoChallengeSolver.solve(
-            challenge.prefix, challenge.target, num_threads=num_threads
+            challenge.prefix,
+            challenge.target,
+            num_threads=num_threads,
+            use_numba=self._use_numba,
         )
         return f"{challenge.prefix}:{nonce}"
 
@@ -291,6 +580,14 @@ class LrcLibAPI:
             If no lyrics are provided, the track will be marked as \
                 instrumental.
 
+        .. note::
+            Without `publish_token`, a proof-of-work challenge is solved \
+                first. It is solved in one forked worker process per CPU \
+                where ``fork`` is the multiprocessing start method (Linux \
+                up to Python 3.13), and in the calling process elsewhere, \
+                so no ``if __name__ == "__main__":`` guard is needed on \
+                Windows or macOS.
+
         Parameters
         ----------
         track_name : str
@@ -321,7 +618,7 @@ class LrcLibAPI:
         APIError
             If the request fails
         """
-        endpoint = ENDPOINTS["publish"]
+        url = self._urls["publish"]
 
         if not publish_token:
             publish_token = self._obtain_publish_token()
@@ -338,9 +635,9 @@ class LrcLibAPI:
 
         try:
             response = self._make_request(
-                "POST", endpoint, headers=headers, json=data
+                "POST", url, headers=headers, json=data
             )
-            return response.json()
+            return _json(response)
 
         except APIError as exc:
             raise exc
@@ -0,0 +1,318 @@
+""" Async API for lrclib"""
+
+# the methods mirror LrcLibAPI on purpose
+# pylint: disable=duplicate-code
+
+import asyncio
+import copy
+import functools
+import os
+import warnings
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+try:
+    import httpx
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "AsyncLrcLibAPI requires httpx, install it with"
+        " `pip install lrclibapi[async]`"
+    ) from exc
+
+from .api import BASE_URL, CACHE_SIZE, ENDPOINTS, _json, _search_params
+from .cache import LRUCache
+from .cryptographic_challenge_solver import CryptoChallengeSolver
+from .exceptions import NotFoundError, error_from_response
+from .models import CryptographicChallenge, Lyrics, SearchResult
+
+MAX_CONNECTIONS = 64
+"""Maximum number of concurrent connections of the default client."""
+MAX_KEEPALIVE_CONNECTIONS = 32
+"""Maximum number of idle keep-alive connections of the default client."""
+
+
+class AsyncLrcLibAPI:
+    """
+    Create a new AsyncLrcLibAPI instance, the asyncio counterpart of \
+        :class:`~lrclib.api.LrcLibAPI`. You can optionally pass a custom \
+        base URL and a custom httpx client.
+
+    .. note::
+        requires the `async` extra: ``pip install lrclibapi[async]``
+
+    .. note::
+        use it as an async context manager or call :meth:`aclose` to \
+            close the underlying client.
+
+    Parameters
+    ----------
+    user_agent : str
+        User agent to use for the requests
+    base_url : str, optional
+        Base URL to use for the requests
+    client : httpx.AsyncClient, optional
+        httpx client to use for the requests, if not provided, a new \
+            HTTP/2 client is created
+    cache_size : int, optional
+        Number of lyrics and search results to keep in memory, \
+            defaults to 4096, set to 0 to disable caching.
+    use_numba : bool, optional
+        Solve the publish challenge with the numba compiled solver. \
+            Requires the `numba` extra: ``pip install lrclibapi[numba]``
+
+    Raises
+    ------
+    UserWarning
+        If user_agent is not set
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        user_agent: str,
+        base_url: "str | None" = None,
+        client: "httpx.AsyncClient | None" = None,
+        cache_size: int = CACHE_SIZE,
+        use_numba: bool = False,
+    ):
+        self._base_url = base_url or BASE_URL
+        self._urls = {
+            name: self._base_url + endpoint
+            for name, endpoint in ENDPOINTS.items()
+        }
+        self._get_by_id_url = self._urls["get_by_id"].format
+        self._cache: LRUCache[Any] = LRUCache(cache_size)
+        self._use_numba = use_numba
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+        self.client = client
+
+        if not user_agent:
+            warnings.warn(
+                "Missing user agent, please set it with the `user_agent`"
+                " argument",
+                UserWarning,
+            )
+        else:
+            self.client.headers["User-Agent"] = user_agent
+
+    async def __aenter__(self) -> "AsyncLrcLibAPI":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx client."""
+        await self.client.aclose()
+
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        response = await self.client.request(method, url, **kwargs)
+        if response.is_error:
+            raise error_from_response(response)
+        return response
+
+    async def get_lyrics(  # pylint: disable=too-many-arguments
+        self,
+        track_name: str,
+        artist_name: str,
+        album_name: str,
+        duration: int,
+        cached: bool = False,
+    ) -> Lyrics:
+        """
+        Get lyrics from LRCLIB by track name, artist name, album name and \
+            duration.
+
+        See :meth:`LrcLibAPI.get_lyrics <lrclib.api.LrcLibAPI.get_lyrics>`.
+        """
+        cache_key = (
+            "get",
+            track_name,
+            artist_name,
+            album_name,
+            duration,
+            cached,
+        )
+        lyrics = self._cache.get(cache_key)
+        if lyrics is not None:
+            return copy.copy(lyrics)
+
+        url = self._urls["get_cached" if cached else "get"]
+        params = {
+            "track_name": track_name,
+            "artist_name": artist_name,
+            "album_name": album_name,
+            "duration": duration,
+        }
+        response = await self._make_request("GET", url, params=params)
+        lyrics = Lyrics.from_dict(_json(response))
+        # cache a copy, callers may modify the returned objects
+        self._cache.set(cache_key, copy.copy(lyrics))
+        return lyrics
+
+    async def get_many(
+        self,
+        queries: Iterable[Mapping[str, Any]],
+        max_concurrency: int = MAX_CONNECTIONS,
+    ) -> List["Lyrics | BaseException"]:
+        """
+        Get lyrics for many tracks concurrently.
+
+        .. note::
+            Keep `max_concurrency` at or below the client's connection \
+                pool size (64 for the default client), requests waiting \
+                on a full pool fail with a pool timeout.
+
+        Parameters
+        ----------
+        queries : Iterable[Mapping[str, Any]]
+            Keyword arguments for :meth:`get_lyrics`, one mapping per track
+        max_concurrency : int, optional
+            Number of concurrent requests, defaults to 64
+
+        Returns
+        -------
+        List[Lyrics | BaseException]
+            Lyrics in the same order as `queries`, or the exception raised \
+                for that track, e.g. a NotFoundError, so one failure does \
+                not discard the whole batch
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_one(query: Mapping[str, Any]) -> Lyrics:
+            async with semaphore:
+                return await self.get_lyrics(**query)
+
+        return await asyncio.gather(
+            *(get_one(query) for query in queries), return_exceptions=True
+        )
+
+    async def get_lyrics_by_id(self, lrclib_id: "str | int") -> Lyrics:
+        """
+        Get lyrics from LRCLIB by ID.
+
+        See :meth:`LrcLibAPI.get_lyrics_by_id \
+            <lrclib.api.LrcLibAPI.get_lyrics_by_id>`.
+        """
+        cache_key = ("get_by_id", str(lrclib_id))
+        lyrics = self._cache.get(cache_key)
+        if lyrics is not None:
+            return copy.copy(lyrics)
+
+        url = self._get_by_id_url(id=lrclib_id)
+        response = await self._make_request("GET", url)
+        lyrics = Lyrics.from_dict(_json(response))
+        # cache a copy, callers may modify the returned objects
+        self._cache.set(cache_key, copy.copy(lyrics))
+        return lyrics
+
+    async def search_lyrics(
+        self,
+        query: "str | None" = None,
+        track_name: "str | None" = None,
+        artist_name: "str | None" = None,
+        album_name: "str | None" = None,
+    ) -> SearchResult:
+        """
+        Search lyrics on LRCLIB by query, track name, artist name and/or \
+            album name.
+
+        See :meth:`LrcLibAPI.search_lyrics \
+            <lrclib.api.LrcLibAPI.search_lyrics>`.
+        """
+        params = _search_params(query, track_name, artist_name, album_name)
+        cache_key = ("search", *params.items())
+        result = self._cache.get(cache_key)
+        if result is not None:
+            return SearchResult(result)
+
+        try:
+            response = await self._make_request(
+                "GET", self._urls["search"], params=params
+            )
+        except NotFoundError:
+            return SearchResult([])
+        result = SearchResult.from_list(_json(response))
+        self._cache.set(cache_key, SearchResult(result))
+        return result
+
+    async def request_challenge(self) -> CryptographicChallenge:
+        """
+        Generate a pair of prefix and target strings for the \
+            cryptographic challenge.
+
+        See :meth:`LrcLibAPI.request_challenge \
+            <lrclib.api.LrcLibAPI.request_challenge>`.
+        """
+        url = self._urls["request_challenge"]
+        response = await self._make_request("POST", url)
+        return CryptographicChallenge.from_dict(_json(response))
+
+    async def _obtain_publish_token(self) -> str:
+        """
+        Obtain a Publish Token for submitting lyrics to LRCLIB, the \
+            challenge is solved in an executor to keep the event loop free.
+
+        Returns
+        -------
+        publish_token : str
+        """
+        num_threads = os.cpu_count() or 1
+        challenge = await self.request_challenge()
+        nonce = await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                CryptoChallengeSolver.solve,
+                challenge.prefix,
+                challenge.target,
+                num_threads=num_threads,
+                use_numba=self._use_numba,
+            ),
+        )
+        return f"{challenge.prefix}:{nonce}"
+
+    async def publish_lyrics(  # pylint: disable=too-many-arguments
+        self,
+        track_name: str,
+        artist_name: str,
+        album_name: str,
+        duration: int,
+        plain_lyrics: Optional[str] = None,
+        synced_lyrics: Optional[str] = None,
+        publish_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Publish lyrics to LRCLIB.
+
+        See :meth:`LrcLibAPI.publish_lyrics \
+            <lrclib.api.LrcLibAPI.publish_lyrics>`.
+        """
+        url = self._urls["publish"]
+
+        if not publish_token:
+            publish_token = await self._obtain_publish_token()
+
+        headers = {"X-Publish-Token": publish_token}
+        data = {
+            "trackName": track_name,
+            "artistName": artist_name,
+            "albumName": album_name,
+            "duration": duration,
+            "plainLyrics": plain_lyrics,
+            "syncedLyrics": synced_lyrics,
+        }
+        response = await self._make_request(
+            "POST", url, headers=headers, json=data
+        )
+        return _json(response)
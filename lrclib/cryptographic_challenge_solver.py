@@ -3,22 +3,40 @@
 # https://github.com/tranxuanthang/lrcget/blob/main/src-tauri/src/lrclib/challenge_solver.rs
 
 import hashlib
+import logging
+import multiprocessing
+import sys
 import threading
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Optional
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+STOP_CHECK_INTERVAL = 4096
+"""Number of nonces a worker tries between checks of the stop signal."""
+
+
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class Solution:
     """Class for storing the solution of a cryptographic challenge."""
 
     prefix: str
     """The prefix string of the challenge."""
-    target_hex: str
-    """The target hash in hexadecimal format."""
+    target: bytes
+    """The target hash."""
     nonce: Optional[int] = None
     """The nonce that satisfies the target hash."""
 
+    @property
+    def target_hex(self) -> str:
+        """The target hash in hexadecimal format."""
+        return self.target.hex()
+
     @property
     def is_solved(self) -> bool:
         """Check if the challenge is solved."""
@@ -32,37 +50,136 @@ def is_nonce_valid(prefix: str, nonce: "int | str", target: bytes) -> bool:
     return hash_value < target
 
 
-def find_nonce(
+def find_nonce(  # pylint: disable=too-many-arguments
     prefix: str,
     target: bytes,
     solution: Optional[Solution] = None,
     start: int = 0,
     step: int = 1,
+    stop_event: "Optional[threading.Event]" = None,
 ) -> Solution:
     """Find the nonce that satisfies the target hash such that the hash of \
     the prefix concatenated with the nonce is less than the target hash.
+
+    Searches the nonces ``start, start + step, ...``. Every \
+    :data:`STOP_CHECK_INTERVAL` nonces, the search gives up when another \
+    searcher sharing `solution` has solved it, or when `stop_event` is \
+    given and set. `stop_event` is set once a nonce is found, and \
+    `solution.nonce` is only set if no other searcher set it first.
     """
     if solution is None:
-        solution = Solution(prefix, target.hex())
+        solution = Solution(prefix, target)
+    if solution.is_solved:
+        return solution
 
+    # hot loop: `is_nonce_valid` is inlined to avoid the per-nonce call,
+    # f-string and encode overhead. The prefix is absorbed once and the
+    # hash state is copied for each nonce instead of rehashing the prefix.
+    midstate_copy = hashlib.sha256(prefix.encode()).copy
     nonce = start
-    while not solution.is_solved:
-        if is_nonce_valid(prefix, nonce, target):
-            solution.nonce = nonce
-            print(f"Found nonce: {nonce}")
+    countdown = STOP_CHECK_INTERVAL
+    while True:
+        hasher = midstate_copy()
+        hasher.update(b"%d" % nonce)
+        if hasher.digest() < target:
+            if solution.nonce is None:
+                solution.nonce = nonce
+                logger.debug("Found nonce: %d", nonce)
+            if stop_event is not None:
+                stop_event.set()
             break
         nonce += step
+        countdown -= 1
+        if not countdown:
+            if solution.is_solved or (
+                stop_event is not None and stop_event.is_set()
+            ):
+                break
+            countdown = STOP_CHECK_INTERVAL
 
     return solution
 
 
+_found: Any = None  # pylint: disable=invalid-name
+"""Shared ``multiprocessing.Value`` holding the found nonce, -1 until one \
+is found, set in each worker process by :func:`_init_worker`."""
+
+
+def _import_pow_numba() -> Any:
+    """Import the numba compiled search on first use, importing numba takes \
+    a few hundred milliseconds."""
+    try:
+        from . import _pow_numba  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "The numba solver requires numba, install it with"
+            " `pip install lrclibapi[numba]`"
+        ) from exc
+    return _pow_numba
+
+
+def _forks_workers() -> bool:
+    """Check if worker processes start as forks of this process, other start \
+    methods run the main module again in every worker."""
+    return multiprocessing.get_context().get_start_method() == "fork"
+
+
+def _init_worker(found: Any) -> None:
+    """Store the shared nonce value in the worker process."""
+    global _found  # pylint: disable=global-statement
+    _found = found
+
+
+def _find_nonce_worker(
+    prefix: str, target: bytes, start: int, step: int
+) -> None:
+    """Search the nonces ``start, start + step, ...`` in a worker process.
+
+    Publishes the first valid nonce in the shared value unless another \
+    worker already did, and returns once the shared value is set.
+    """
+    found = _found
+    midstate_copy = hashlib.sha256(prefix.encode()).copy
+    nonce = start
+    countdown = STOP_CHECK_INTERVAL
+    while True:
+        hasher = midstate_copy()
+        hasher.update(b"%d" % nonce)
+        if hasher.digest() < target:
+            with found.get_lock():
+                if found.value < 0:
+                    found.value = nonce
+            return
+        nonce += step
+        countdown -= 1
+        if not countdown:
+            if found.value >= 0:
+                return
+            countdown = STOP_CHECK_INTERVAL
+
+
 class CryptoChallengeSolver:
     """Class for solving cryptographic challenges."""
 
     @staticmethod
-    def solve(prefix: str, target_hex: str, num_threads: int = 1):
+    def solve(
+        prefix: str,
+        target_hex: str,
+        num_threads: int = 1,
+        use_numba: bool = False,
+    ):
         """Solve the cryptographic challenge.
 
+        .. note::
+            With `use_numba` the search runs compiled in `num_threads` \
+                threads, the first call in a fresh environment compiles \
+                it, which takes a few seconds. Otherwise, with \
+                `num_threads` greater than 1 the search runs in forked \
+                worker processes where ``fork`` is the start method \
+                (Linux up to Python 3.13). With other start methods \
+                (Windows, macOS) it runs in the calling process, as those \
+                would run the calling script again in every worker.
+
         Parameters
         ----------
         prefix : str
@@ -70,30 +187,77 @@ class CryptoChallengeSolver:
         target_hex : str
             The target hash in hexadecimal format.
         num_threads : int
-            The number of threads to use for solving the challenge.
+            The number of worker threads or processes to use for solving \
+                the challenge.
+        use_numba : bool
+            Search with the numba compiled solver. Requires the `numba` \
+                extra: ``pip install lrclibapi[numba]``
 
         Returns
         -------
         nonce : str
             The nonce that satisfies the target hash.
+
+        Raises
+        ------
+        ImportError
+            If `use_numba` is set but numba is not installed
         """
+        if use_numba:
+            _import_pow_numba()
+
         target = bytes.fromhex(target_hex)
-        step = num_threads
-        threads: List[threading.Thread] = []
-        solution = Solution(prefix, target.hex())
-
-        for i in range(num_threads):
-            start = i
-            thread = threading.Thread(
-                target=find_nonce,
-                args=(prefix, target, solution, start, step),
+        if use_numba and len(target) == 32:
+            return CryptoChallengeSolver._solve_numba(
+                prefix, target, num_threads
             )
-            threads.append(thread)
+        if num_threads <= 1 or not _forks_workers():
+            return str(find_nonce(prefix, target).nonce)
 
-        for thread in threads:
-            thread.start()
+        # each worker searches a disjoint stride of nonces, the first one to
+        # find a valid nonce publishes it, the others see it and stop
+        found = multiprocessing.Value("q", -1)
+        with ProcessPoolExecutor(
+            max_workers=num_threads,
+            initializer=_init_worker,
+            initargs=(found,),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _find_nonce_worker, prefix, target, start, num_threads
+                )
+                for start in range(num_threads)
+            ]
+            next(as_completed(futures)).result()
+
+        return str(found.value)
+
+    @staticmethod
+    def _solve_numba(prefix: str, target: bytes, num_threads: int) -> str:
+        """Solve the challenge with the numba compiled search, the compiled \
+            code releases the GIL so the threads search in parallel."""
+        find_nonce_nb = _import_pow_numba().find_nonce_nb
+        prefix_bytes = prefix.encode()
+        if num_threads <= 1:
+            return str(find_nonce_nb(prefix_bytes, target))
 
-        for thread in threads:
-            thread.join()
+        nonce = None
+        stop_event = threading.Event()
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = [
+                executor.submit(
+                    find_nonce_nb,
+                    prefix_bytes,
+                    target,
+                    start,
+                    num_threads,
+                    stop_event,
+                )
+                for start in range(num_threads)
+            ]
+            for future in as_completed(futures):
+                nonce = future.result()
+                if nonce is not None:
+                    break
 
-        return str(solution.nonce)
+        return str(nonce)
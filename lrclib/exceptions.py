@@ -1,20 +1,45 @@
 """Exceptions for the LRC API."""
 
+from functools import cached_property
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Union
+
 import requests
 
+if TYPE_CHECKING:
+    import httpx
+
+Response = Union[requests.Response, "httpx.Response"]
+
 
 class APIError(requests.exceptions.RequestException):
     """Base class for API errors."""
 
-    def __init__(self, response: requests.Response) -> None:
-        self.response = response
+    # narrowed from RequestException's Optional[requests.Response], an
+    # APIError always carries the requests or httpx response it came from
+    response: Response  # type: ignore[assignment]
+
+    def __init__(self, response: Response) -> None:
         self.status_code = response.status_code
-        self.reason = response.reason
+        # httpx names the reason `reason_phrase`
+        self.reason = getattr(response, "reason", None) or getattr(
+            response, "reason_phrase", None
+        )
         self.url = response.url
-        self.text = response.text
-        self.headers = response.headers
 
         super().__init__(f"{self.status_code} {self.reason} for {self.url}")
+        # set after RequestException.__init__, which resets it to None
+        self.response = response
+
+    @cached_property
+    def text(self) -> str:
+        """Body of the failed response, decoded on first access."""
+        return self.response.text
+
+    @property
+    def headers(self) -> Any:
+        """Headers of the failed response."""
+        return self.response.headers
 
 
 class NotFoundError(APIError):
@@ -31,3 +56,16 @@ class RateLimitError(APIError):
 
 class IncorrectPublishTokenError(APIError):
     """Raised when the publish token is incorrect."""
+
+
+def error_from_response(response: Response) -> APIError:
+    """Create the APIError matching the status code of a failed response."""
+    if response.status_code == HTTPStatus.NOT_FOUND:
+        return NotFoundError(response)
+    if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        return RateLimitError(response)
+    if response.status_code == HTTPStatus.BAD_REQUEST:
+        return IncorrectPublishTokenError(response)
+    if 500 <= response.status_code < 600:
+        return ServerError(response)
+    return APIError(response)
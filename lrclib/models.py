@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, ClassVar, Dict, Generic, List, Optional, TypeVar
+from operator import itemgetter
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 APIKey = TypeVar("APIKey", bound=str)
 
@@ -14,23 +27,83 @@ KeyMapping = Dict[APIKey, ModelAttr]
 
 ModelT = TypeVar("ModelT", bound="BaseModel")
 
+# instances are created per search row, slots drop the per-instance __dict__
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
-class BaseModel(Generic[ModelT]):
+
+class BaseModel:
     """Base model"""
 
+    __slots__ = ()
+
     _API_TO_MODEL_MAPPINGS: ClassVar[KeyMapping] = {}
+    _MAPPING_ITEMS: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # the mapping is fixed once the class is defined
+        cls._MAPPING_ITEMS = tuple(cls._API_TO_MODEL_MAPPINGS.items())
+        if "from_dict" not in cls.__dict__:
+            fields = [
+                name
+                for name, annotation in cls.__dict__.get(
+                    "__annotations__", {}
+                ).items()
+                if not str(annotation).startswith("ClassVar")
+            ]
+            attrs = [attr for _, attr in cls._MAPPING_ITEMS]
+            cls.from_dict = _compile_from_dict(  # type: ignore
+                cls.__qualname__, cls._MAPPING_ITEMS, attrs == fields
+            )
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> ModelT:
+    def from_dict(cls: Type[ModelT], data: Mapping[str, Any]) -> ModelT:
         """Create a ModelT object from a dictionary"""
-        kwargs = {}
-        for key, value in cls._API_TO_MODEL_MAPPINGS.items():
-            kwargs[value] = data.get(key)
-        return cls(**kwargs)  # type: ignore
-
-
-@dataclass
-class LyricsMinimal(BaseModel["LyricsMinimal"]):
+        get = data.get
+        return cls(  # type: ignore
+            **{attr: get(key) for key, attr in cls._MAPPING_ITEMS}
+        )
+
+
+def _compile_from_dict(
+    qualname: str, items: Tuple[Tuple[str, str], ...], positional: bool
+) -> Any:
+    """Generate a `from_dict` classmethod with the mapping `items` \
+    unrolled into keyword arguments, e.g. \
+    ``cls(id=get("id"), track_name=get("trackName"), ...)``.
+
+    If `positional`, i.e. the mapping follows the field order, all values \
+    are first fetched with one :func:`operator.itemgetter` call and passed \
+    positionally, falling back to the keyword form if a key is missing.
+    """
+    arguments = ", ".join(f"{attr}=get({key!r})" for key, attr in items)
+    lines = ["def from_dict(cls, data):\n"]
+    # with a single key itemgetter returns the bare value, not a tuple
+    positional = positional and len(items) > 1
+    if positional:
+        lines.append(
+            "    try:\n"
+            "        values = getter(data)\n"
+            "    except KeyError:\n"
+            "        pass\n"
+            "    else:\n"
+            "        return cls(*values)\n"
+        )
+    lines.append(f"    get = data.get\n    return cls({arguments})\n")
+    namespace: Dict[str, Any] = {}
+    if positional:
+        namespace["getter"] = itemgetter(*(key for key, _ in items))
+    exec("".join(lines), namespace)  # pylint: disable=exec-used
+    from_dict = namespace["from_dict"]
+    from_dict.__doc__ = BaseModel.from_dict.__doc__
+    from_dict.__qualname__ = f"{qualname}.from_dict"
+    return classmethod(from_dict)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class LyricsMinimal(BaseModel):
     """Lyrics object with minimal information"""
 
     id: int  # pylint: disable=invalid-name
@@ -56,8 +129,8 @@ class LyricsMinimal(BaseModel["LyricsMinimal"]):
     }
 
 
-@dataclass
-class Lyrics(BaseModel["Lyrics"]):
+@dataclass(**_DATACLASS_OPTIONS)
+class Lyrics(BaseModel):
     """Lyrics object with full information"""
 
     id: int  # pylint: disable=invalid-name
@@ -95,14 +168,15 @@ class Lyrics(BaseModel["Lyrics"]):
         if self.release_date is not None:
             if not isinstance(self.release_date, str):
                 return
-            # 2023-08-10T00:00:00Z
-            self.release_date = datetime.strptime(
-                self.release_date, "%Y-%m-%dT%H:%M:%SZ"
+            # 2023-08-10T00:00:00Z, the "Z" is dropped to keep the datetime
+            # naive and because fromisoformat only accepts it on 3.11+
+            self.release_date = datetime.fromisoformat(
+                self.release_date.rstrip("Z")
             )
 
 
-@dataclass
-class ErrorResponse(BaseModel["ErrorResponse"]):
+@dataclass(**_DATACLASS_OPTIONS)
+class ErrorResponse(BaseModel):
     """Response sent when an error occurs on the server"""
 
     status_code: int
@@ -123,16 +197,16 @@ class SearchResult(List[LyricsMinimal]):
         super().__init__(data)
 
     @classmethod
-    def from_list(cls, data: List[Dict[str, Any]]) -> "SearchResult":
+    def from_list(
+        cls, data: Iterable[Mapping[str, Any]]
+    ) -> "SearchResult":
         """Create a SearchResult object from a list of dictionaries"""
 
-        results = [LyricsMinimal.from_dict(result) for result in data]
-
-        return cls(results)
+        return cls(list(map(LyricsMinimal.from_dict, data)))
 
 
-@dataclass
-class CryptographicChallenge(BaseModel["CryptographicChallenge"]):
+@dataclass(**_DATACLASS_OPTIONS)
+class CryptographicChallenge(BaseModel):
     """Cryptographic Challenge"""
 
     prefix: str
@@ -0,0 +1,55 @@
+""" Shared fixtures for the tests. """
+
+import json
+from typing import Any, Callable, Iterator, Optional
+from unittest.mock import Mock
+
+import pytest
+from requests import Session
+
+from lrclib.api import LrcLibAPI
+
+
+@pytest.fixture(scope="session")
+def api() -> LrcLibAPI:
+    # Create one instance of the LrcLibAPI class for the whole test session
+    return LrcLibAPI(user_agent="test_user_agent")
+
+
+@pytest.fixture(autouse=True)
+def restore_api(request: pytest.FixtureRequest) -> Iterator[None]:
+    # tests replace `api.session` on the shared instance, put it back and
+    # drop cached results so every test starts clean, methods are patched
+    # with `monkeypatch` which undoes itself
+    if "api" not in request.fixturenames:
+        yield
+        return
+
+    api: LrcLibAPI = request.getfixturevalue("api")
+    session = api.session
+    yield
+    api.session = session
+    api._cache.clear()  # pylint: disable=protected-access
+
+
+@pytest.fixture
+def mock_session(api: LrcLibAPI) -> Callable[..., Mock]:
+    # install a session mock on `target`, the shared `api` by default, that
+    # returns `return_json` as the response body, or runs `side_effect`
+    def _install(
+        return_json: Any = None,
+        side_effect: Any = None,
+        target: Optional[LrcLibAPI] = None,
+    ) -> Mock:
+        session_mock = Mock(spec=Session)
+        if side_effect is not None:
+            session_mock.configure_mock(**{"request.side_effect": side_effect})
+        else:
+            body = json.dumps(return_json).encode()
+            session_mock.configure_mock(
+                **{"request.return_value.content": body}
+            )
+        (api if target is None else target).session = session_mock
+        return session_mock
+
+    return _install
@@ -0,0 +1,59 @@
+""" Tests for LrcLibAPI on an httpx client against a mock transport. """
+
+from typing import Any, List
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+# pylint: disable=wrong-import-position
+from lrclib.api import BASE_URL, ENDPOINTS, LrcLibAPI  # noqa: E402
+from lrclib.exceptions import NotFoundError, ServerError  # noqa: E402
+from lrclib.models import Lyrics  # noqa: E402
+
+sample_lyrics = {
+    "id": 123,
+    "trackName": "test_track_name",
+    "artistName": "test_artist_name",
+    "albumName": "test_album_name",
+    "duration": 180,
+    "instrumental": False,
+}
+
+
+def make_api(status_code: int, requests: List[Any]) -> LrcLibAPI:
+    def handler(request: Any) -> Any:
+        requests.append(request)
+        return httpx.Response(status_code, json=sample_lyrics)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return LrcLibAPI(user_agent="test_user_agent", session=client)
+
+
+def test_http2_client() -> None:
+    api = LrcLibAPI(user_agent="test_user_agent", http2=True)
+    assert isinstance(api.session, httpx.Client)
+    assert api.session.headers["User-Agent"] == "test_user_agent"
+    assert api.session.follow_redirects
+
+
+def test_get_lyrics_by_id() -> None:
+    requests: List[Any] = []
+    api = make_api(200, requests)
+
+    result = api.get_lyrics_by_id(123)
+
+    assert result == Lyrics.from_dict(sample_lyrics)
+    assert str(requests[0].url) == BASE_URL + ENDPOINTS["get_by_id"].format(
+        id=123
+    )
+
+
+@pytest.mark.parametrize(
+    "status_code, error", [(404, NotFoundError), (500, ServerError)]
+)
+def test_errors(status_code: int, error: type) -> None:
+    api = make_api(status_code, [])
+
+    with pytest.raises(error):
+        api.get_lyrics_by_id(123)
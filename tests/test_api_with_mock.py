@@ -1,19 +1,15 @@
+import json
 import os
-import warnings
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 from unittest.mock import Mock
 
 import pytest
-from requests import HTTPError, Response
+from requests import Response
 
 from lrclib.api import BASE_URL, ENDPOINTS, LrcLibAPI
 from lrclib.cryptographic_challenge_solver import CryptoChallengeSolver
-from lrclib.exceptions import (
-    APIError,
-    IncorrectPublishTokenError,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-)
+from lrclib.exceptions import NotFoundError
 from lrclib.models import (
     CryptographicChallenge,
     Lyrics,
@@ -22,46 +18,55 @@ from lrclib.models import (
 )
 
 
-@pytest.fixture(scope="module")
-def api() -> LrcLibAPI:
-    # Create an instance of the LrcLibAPI class
-    _api = LrcLibAPI(user_agent="test_user_agent")
-    # mock = Mock()
-    # api.session = mock
-    return _api
-
+# the failed response an APIError is built from
+NOT_FOUND_RESPONSE = Response()
+NOT_FOUND_RESPONSE.status_code = 404
 
-def test_get_lyrics(
-    api: LrcLibAPI,  # pylint: disable=redefined-outer-name
-) -> None:
-    # Set up a sample track signature
-    track_name = "I Want to Live"
-    artist_name = "Borislav Slavov"
-    album_name = "Baldur's Gate 3 (Original Game Soundtrack)"
-    duration = 233
+sample_lyrics = {"lyrics": "test lyrics"}
+expected_lyrics = Lyrics.from_dict(sample_lyrics)
+expected_search_result = SearchResult(
+    [LyricsMinimal.from_dict(sample_lyrics)]
+)
 
-    # Set up a sample response
-    sample_response = {
+# read-only, the get_lyrics tests only ever compare against it
+sample_response: Mapping[str, Any] = MappingProxyType(
+    {
         "id": 3396226,
-        "trackName": track_name,
-        "artistName": artist_name,
-        "albumName": album_name,
-        "duration": duration,
+        "trackName": "I Want to Live",
+        "artistName": "Borislav Slavov",
+        "albumName": "Baldur's Gate 3 (Original Game Soundtrack)",
+        "duration": 233,
         "instrumental": False,
         "plainLyrics": (
-            "I feel your breath upon my neck\n...The clock won't stop and this"
-            " is what we get\n"
+            "I feel your breath upon my neck\n...The clock won't stop and"
+            " this is what we get\n"
         ),
         "syncedLyrics": (
             "[00:17.12] I feel your breath upon my neck\n...[03:20.31] The"
             " clock won't stop and this is what we get\n[03:25.72] "
         ),
     }
-    # Mock the requests.Session object
-    session_mock = Mock()
-    session_mock.request.return_value.json.return_value = sample_response
+)
+
+URL_GET = BASE_URL + ENDPOINTS["get"]
+URL_GET_CACHED = BASE_URL + ENDPOINTS["get_cached"]
+URL_GET_BY_ID_123 = BASE_URL + ENDPOINTS["get_by_id"].format(id=123)
+URL_SEARCH = BASE_URL + ENDPOINTS["search"]
+URL_PUBLISH = BASE_URL + ENDPOINTS["publish"]
+URL_CHALLENGE = BASE_URL + ENDPOINTS["request_challenge"]
 
-    api.session = session_mock
+
+def test_get_lyrics(
+    api: LrcLibAPI,  # pylint: disable=redefined-outer-name
+    mock_session: Callable[..., Mock],
+) -> None:
+    # Set up a sample track signature
+    track_name = sample_response["trackName"]
+    artist_name = sample_response["artistName"]
+    album_name = sample_response["albumName"]
+    duration = sample_response["duration"]
+
+    session_mock = mock_session(return_json=dict(sample_response))
 
     result = api.get_lyrics(
         track_name, artist_name, album_name, duration, cached=False
@@ -69,7 +74,7 @@ def test_get_lyrics(
 
     session_mock.request.assert_called_once_with(
         "GET",
-        BASE_URL + ENDPOINTS["get"],
+        URL_GET,
         params={
             "track_name": track_name,
             "artist_name": artist_name,
@@ -82,15 +87,10 @@ def test_get_lyrics(
     assert result == Lyrics.from_dict(sample_response)
 
 
-def test_get_cached_lyrics(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
-    session_mock.request.return_value.json.return_value = {
-        "lyrics": "test lyrics"
-    }
-
-    # Set the session object of the LrcLibAPI instance to the mock object
-    api.session = session_mock
+def test_get_cached_lyrics(
+    api: LrcLibAPI, mock_session: Callable[..., Mock]
+) -> None:
+    session_mock = mock_session(return_json=sample_lyrics)
 
     # Call the get_lyrics method with the cached argument set to True
     result = api.get_lyrics(
@@ -104,7 +104,7 @@ def test_get_cached_lyrics(api: LrcLibAPI) -> None:
     # Check that the session's request method was called with the correct arguments
     session_mock.request.assert_called_once_with(
         "GET",
-        BASE_URL + ENDPOINTS["get_cached"],
+        URL_GET_CACHED,
         params={
             "track_name": "test_track_name",
             "artist_name": "test_artist_name",
@@ -113,91 +113,72 @@ def test_get_cached_lyrics(api: LrcLibAPI) -> None:
         },
     )
 
-    assert result == Lyrics.from_dict({"lyrics": "test lyrics"})
+    assert result == expected_lyrics
 
 
-def test_get_lyrics_by_id(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
-    session_mock.request.return_value.json.return_value = {
-        "lyrics": "test lyrics"
-    }
-
-    # Set the session object of the LrcLibAPI instance to the mock object
-    api.session = session_mock
+def test_get_lyrics_by_id(
+    api: LrcLibAPI, mock_session: Callable[..., Mock]
+) -> None:
+    session_mock = mock_session(return_json=sample_lyrics)
 
     # Call the get_lyrics_by_id method
     result = api.get_lyrics_by_id(123)
 
     # Check that the session's request method was called with the correct arguments
-    session_mock.request.assert_called_once_with(
-        "GET", BASE_URL + ENDPOINTS["get_by_id"].format(id=123)
-    )
+    session_mock.request.assert_called_once_with("GET", URL_GET_BY_ID_123)
 
-    assert result == Lyrics.from_dict({"lyrics": "test lyrics"})
+    assert result == expected_lyrics
 
 
-def test_search_lyrics(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
-    test_lyrics = {"lyrics": "test lyrics"}
-    session_mock.request.return_value.json.return_value = [test_lyrics]
-
-    # Set the session object of the LrcLibAPI instance to the mock object
-    api.session = session_mock
+def test_search_lyrics(
+    api: LrcLibAPI, mock_session: Callable[..., Mock]
+) -> None:
+    session_mock = mock_session(return_json=[sample_lyrics])
 
     # Call the search_lyrics method
     result = api.search_lyrics(query="test_query")
 
     # Check that the session's request method was called with the correct arguments
     session_mock.request.assert_called_once_with(
-        "GET", BASE_URL + ENDPOINTS["search"], params={"q": "test_query"}
+        "GET", URL_SEARCH, params={"q": "test_query"}
     )
 
-    assert result == SearchResult([LyricsMinimal.from_dict(test_lyrics)])
+    assert result == expected_search_result
 
 
-def test_request_challenge(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
+def test_request_challenge(
+    api: LrcLibAPI, mock_session: Callable[..., Mock]
+) -> None:
     sample_return = {
         "prefix": "test_prefix",
         "target": "test_target",
     }
-
-    session_mock.request.return_value.json.return_value = sample_return
-
-    # Set the session object of the LrcLibAPI instance to the mock object
-    api.session = session_mock
+    session_mock = mock_session(return_json=sample_return)
 
     # Call the request_challenge method
     result = api.request_challenge()
 
     # Check that the session's request method was called with the correct arguments
-    session_mock.request.assert_called_once_with(
-        "POST", BASE_URL + ENDPOINTS["request_challenge"]
-    )
+    session_mock.request.assert_called_once_with("POST", URL_CHALLENGE)
 
     assert result == CryptographicChallenge.from_dict(sample_return)
 
 
-def test_publish_lyrics(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
-    session_mock.request.return_value.json.return_value = {"status": "success"}
+def test_publish_lyrics(
+    api: LrcLibAPI,
+    mock_session: Callable[..., Mock],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session_mock = mock_session(return_json={"status": "success"})
 
-    # Mock the challenge
+    # Mock the challenge, solving it for real is covered by the solver tests
     request_challenge = Mock()
     simple_challenge = CryptographicChallenge("test_prefix", "0f")
-    solution = CryptoChallengeSolver.solve(
-        simple_challenge.prefix,
-        simple_challenge.target,
-        num_threads=os.cpu_count() or 1,
-    )
     request_challenge.return_value = simple_challenge
-
-    api.session = session_mock
-    api.request_challenge = request_challenge
+    solution = "1234"
+    solve = Mock(return_value=solution)
+    monkeypatch.setattr(CryptoChallengeSolver, "solve", solve)
+    monkeypatch.setattr(api, "request_challenge", request_challenge)
 
     # Call the publish_lyrics method
     result = api.publish_lyrics(
@@ -212,7 +193,7 @@ def test_publish_lyrics(api: LrcLibAPI) -> None:
     # Check that the session's request method was called with the correct arguments
     session_mock.request.assert_called_once_with(
         "POST",
-        BASE_URL + ENDPOINTS["publish"],
+        URL_PUBLISH,
         headers={"X-Publish-Token": f"{simple_challenge.prefix}:{solution}"},
         json={
             "trackName": "test_track_name",
@@ -224,5 +205,94 @@ def test_publish_lyrics(api: LrcLibAPI) -> None:
         },
     )
 
+    solve.assert_called_once_with(
+        simple_challenge.prefix,
+        simple_challenge.target,
+        num_threads=os.cpu_count() or 1,
+        use_numba=False,
+    )
+
     # Check that the result is the expected dictionary
     assert result == {"status": "success"}
+
+
+def test_lyrics_are_cached(
+    api: LrcLibAPI, mock_session: Callable[..., Mock]
+) -> None:
+    session_mock = mock_session(return_json={"id": 123})
+
+    first = api.get_lyrics_by_id(123)
+    second = api.get_lyrics_by_id("123")
+
+    session_mock.request.assert_called_once()
+    assert second == first
+    assert second is not first
+
+    # modifying a returned object leaves the cached one untouched
+    first.id = 456
+    assert api.get_lyrics_by_id(123).id == 123
+
+
+def test_search_results_are_cached(
+    api: LrcLibAPI, mock_session: Callable[..., Mock]
+) -> None:
+    session_mock = mock_session(return_json=[{"id": 123}])
+
+    first = api.search_lyrics(query="test_query")
+    first.clear()
+    second = api.search_lyrics(query="test_query")
+
+    session_mock.request.assert_called_once()
+    assert second == SearchResult.from_list([{"id": 123}])
+
+
+def test_cache_disabled(mock_session: Callable[..., Mock]) -> None:
+    _api = LrcLibAPI(user_agent="test_user_agent", cache_size=0)
+    session_mock = mock_session(return_json=[{"id": 123}], target=_api)
+
+    _api.search_lyrics(query="test_query")
+    _api.search_lyrics(query="test_query")
+
+    assert session_mock.request.call_count == 2
+
+
+def test_get_lyrics_batch(
+    api: LrcLibAPI, mock_session: Callable[..., Mock]
+) -> None:
+    def request(method: str, url: str, params: dict) -> Mock:
+        if params["track_name"] == "missing":
+            raise NotFoundError(NOT_FOUND_RESPONSE)
+        response = Mock()
+        body = json.dumps({"trackName": params["track_name"]})
+        response.content = body.encode()
+        return response
+
+    mock_session(side_effect=request)
+
+    queries = [
+        {
+            "track_name": track_name,
+            "artist_name": "test_artist_name",
+            "album_name": "test_album_name",
+            "duration": 180,
+        }
+        for track_name in ("first", "missing", "last")
+    ]
+    first, missing, last = api.get_lyrics_batch(queries, max_workers=2)
+
+    assert isinstance(first, Lyrics) and first.track_name == "first"
+    assert isinstance(missing, NotFoundError)
+    assert isinstance(last, Lyrics) and last.track_name == "last"
+
+
+def test_iter_search_results(
+    api: LrcLibAPI, mock_session: Callable[..., Mock]
+) -> None:
+    session_mock = mock_session(return_json=[{"id": i} for i in range(10)])
+
+    results = list(api.iter_search_results(query="test_query", limit=3))
+
+    assert results == [LyricsMinimal.from_dict({"id": i}) for i in range(3)]
+    session_mock.request.assert_called_once_with(
+        "GET", URL_SEARCH, params={"q": "test_query"}
+    )
@@ -1,16 +1,14 @@
+import os
+from dataclasses import replace
 from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Mapping
+
 import pytest
 import vcr
 
-from lrclib.api import BASE_URL, ENDPOINTS, LrcLibAPI
-from lrclib.exceptions import (
-    APIError,
-    IncorrectPublishTokenError,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-)
-
+from lrclib.api import LrcLibAPI
+from lrclib.exceptions import NotFoundError
 from lrclib.models import (
     CryptographicChallenge,
     Lyrics,
@@ -19,38 +17,41 @@ from lrclib.models import (
 )
 
 
-@pytest.fixture(scope="module")
-def api() -> LrcLibAPI:
-    # Create an instance of the LrcLibAPI class
-    _api = LrcLibAPI(user_agent="test_user_agent")
-    return _api
-
-
+# never hit the network in CI, set VCR_RECORD_MODE to re-record cassettes
 my_vcr = vcr.VCR(
     cassette_library_dir="tests/fixtures/cassettes",
-    record_mode="once",
+    record_mode=os.environ.get(
+        "VCR_RECORD_MODE", "none" if os.environ.get("CI") else "once"
+    ),
+    serializer="json",
 )
 
-expected_content = {
-    "id": 3396226,
-    "name": "I Want to Live",
-    "trackName": "I Want to Live",
-    "artistName": "Borislav Slavov",
-    "albumName": "Baldur's Gate 3 (Original Game Soundtrack)",
-    "duration": 233,
-    "instrumental": False,
-    "lang": "en",
-    "isrc": "BGA472329253",
-    "spotifyId": "5Y94QNZmNoHid18Y7c5Al9",
-    "releaseDate": "2023-08-10T00:00:00Z",
-    "plainLyrics": (
-        "I feel your breath upon my neck\nA soft caress as cold as death\n"
-    ),
-    "syncedLyrics": (
-        "[00:17.12] I feel your breath upon my neck\n[00:20.41] A soft caress"
-        " as cold as death\n"
-    ),
-}
+expected_content: Mapping[str, Any] = MappingProxyType(
+    {
+        "id": 3396226,
+        "name": "I Want to Live",
+        "trackName": "I Want to Live",
+        "artistName": "Borislav Slavov",
+        "albumName": "Baldur's Gate 3 (Original Game Soundtrack)",
+        "duration": 233,
+        "instrumental": False,
+        "lang": "en",
+        "isrc": "BGA472329253",
+        "spotifyId": "5Y94QNZmNoHid18Y7c5Al9",
+        "releaseDate": "2023-08-10T00:00:00Z",
+        "plainLyrics": (
+            "I feel your breath upon my neck\n"
+            "A soft caress as cold as death\n"
+        ),
+        "syncedLyrics": (
+            "[00:17.12] I feel your breath upon my neck\n"
+            "[00:20.41] A soft caress as cold as death\n"
+        ),
+    }
+)
+
+expected_release_date = datetime(2023, 8, 10, 0, 0, 0)
+expected_lyrics = Lyrics.from_dict(expected_content)
 
 
 def is_valid_search_result(result: SearchResult) -> bool:
@@ -62,20 +63,19 @@ def is_valid_search_result(result: SearchResult) -> bool:
 
 
 def is_valid_get_result(result: Lyrics) -> bool:
+    if not isinstance(result, Lyrics):
+        return False
+    # the recorded lyrics are longer, only their first lines are expected
+    expected = replace(
+        expected_lyrics,
+        plain_lyrics=result.plain_lyrics,
+        synced_lyrics=result.synced_lyrics,
+    )
     return (
-        isinstance(result, Lyrics)
-        and result.name == expected_content["name"]
-        and result.track_name == expected_content["trackName"]
-        and result.artist_name == expected_content["artistName"]
-        and result.album_name == expected_content["albumName"]
-        and result.duration == expected_content["duration"]
-        and result.instrumental == expected_content["instrumental"]
-        and result.plain_lyrics.startswith(expected_content["plainLyrics"])
-        and result.synced_lyrics.startswith(expected_content["syncedLyrics"])
-        and result.lang == expected_content["lang"]
-        and result.isrc == expected_content["isrc"]
-        and result.spotify_id == expected_content["spotifyId"]
-        and result.release_date == datetime(2023, 8, 10, 0, 0, 0)
+        result == expected
+        and result.release_date == expected_release_date
+        and result.plain_lyrics.startswith(expected_lyrics.plain_lyrics)
+        and result.synced_lyrics.startswith(expected_lyrics.synced_lyrics)
     )
 
 
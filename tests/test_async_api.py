@@ -0,0 +1,199 @@
+""" Tests for the async API against an httpx mock transport. """
+
+import asyncio
+from typing import Any, Callable, List
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+# pylint: disable=wrong-import-position
+from lrclib.api import BASE_URL, ENDPOINTS  # noqa: E402
+from lrclib.async_api import AsyncLrcLibAPI  # noqa: E402
+from lrclib.exceptions import (  # noqa: E402
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+)
+from lrclib.models import Lyrics, LyricsMinimal, SearchResult  # noqa: E402
+
+sample_lyrics = {
+    "id": 123,
+    "trackName": "test_track_name",
+    "artistName": "test_artist_name",
+    "albumName": "test_album_name",
+    "duration": 180,
+    "instrumental": False,
+}
+
+
+def make_api(
+    handler: Callable[[Any], Any], requests: "List[Any] | None" = None
+) -> AsyncLrcLibAPI:
+    def _record(request: Any) -> Any:
+        if requests is not None:
+            requests.append(request)
+        return handler(request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_record))
+    return AsyncLrcLibAPI(user_agent="test_user_agent", client=client)
+
+
+def test_default_client() -> None:
+    api = AsyncLrcLibAPI(user_agent="test_user_agent")
+    assert api.client.headers["User-Agent"] == "test_user_agent"
+    assert api.client.follow_redirects
+    asyncio.run(api.aclose())
+
+
+def test_get_lyrics() -> None:
+    requests: List[Any] = []
+    api = make_api(lambda _: httpx.Response(200, json=sample_lyrics), requests)
+
+    async def run() -> Lyrics:
+        async with api:
+            return await api.get_lyrics(
+                "test_track_name", "test_artist_name", "test_album_name", 180
+            )
+
+    result = asyncio.run(run())
+
+    assert result == Lyrics.from_dict(sample_lyrics)
+    assert len(requests) == 1
+    assert requests[0].url.path == "/api" + ENDPOINTS["get"]
+    assert requests[0].url.params["track_name"] == "test_track_name"
+    assert requests[0].headers["User-Agent"] == "test_user_agent"
+
+
+def test_get_many() -> None:
+    def handler(request: Any) -> Any:
+        return httpx.Response(
+            200,
+            json={
+                **sample_lyrics,
+                "trackName": request.url.params["track_name"],
+            },
+        )
+
+    api = make_api(handler)
+    queries = [
+        {
+            "track_name": f"track_{i}",
+            "artist_name": "test_artist_name",
+            "album_name": "test_album_name",
+            "duration": 180,
+        }
+        for i in range(5)
+    ]
+
+    result = asyncio.run(api.get_many(queries))
+
+    assert result == [
+        Lyrics.from_dict({**sample_lyrics, "trackName": query["track_name"]})
+        for query in queries
+    ]
+
+
+def test_get_many_limits_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    api = make_api(lambda _: httpx.Response(200, json=sample_lyrics))
+    running = peak = 0
+
+    async def get_lyrics(**_: Any) -> Lyrics:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return Lyrics.from_dict(sample_lyrics)
+
+    monkeypatch.setattr(api, "get_lyrics", get_lyrics)
+
+    result = asyncio.run(api.get_many([{}] * 20, max_concurrency=3))
+
+    assert len(result) == 20
+    assert peak == 3
+
+
+def test_get_many_returns_errors_in_place() -> None:
+    def handler(request: Any) -> Any:
+        if request.url.params["track_name"] == "missing":
+            return httpx.Response(404)
+        return httpx.Response(200, json=sample_lyrics)
+
+    api = make_api(handler)
+    queries = [
+        {
+            "track_name": track_name,
+            "artist_name": "test_artist_name",
+            "album_name": "test_album_name",
+            "duration": 180,
+        }
+        for track_name in ("test_track_name", "missing")
+    ]
+
+    result = asyncio.run(api.get_many(queries))
+
+    assert result[0] == Lyrics.from_dict(sample_lyrics)
+    assert isinstance(result[1], NotFoundError)
+
+
+def test_get_lyrics_by_id() -> None:
+    requests: List[Any] = []
+    api = make_api(lambda _: httpx.Response(200, json=sample_lyrics), requests)
+
+    result = asyncio.run(api.get_lyrics_by_id(123))
+
+    assert result == Lyrics.from_dict(sample_lyrics)
+    assert str(requests[0].url) == BASE_URL + ENDPOINTS["get_by_id"].format(
+        id=123
+    )
+
+
+def test_lyrics_are_cached() -> None:
+    requests: List[Any] = []
+    api = make_api(lambda _: httpx.Response(200, json=sample_lyrics), requests)
+
+    async def run() -> List[Lyrics]:
+        first = await api.get_lyrics_by_id(123)
+        first.id = 456
+        return [first, await api.get_lyrics_by_id("123")]
+
+    first, second = asyncio.run(run())
+
+    assert len(requests) == 1
+    assert first is not second
+    assert second == Lyrics.from_dict(sample_lyrics)
+
+
+def test_search_lyrics_empty() -> None:
+    api = make_api(lambda _: httpx.Response(404))
+
+    assert asyncio.run(api.search_lyrics(query="test_query")) == SearchResult(
+        []
+    )
+
+
+def test_search_lyrics() -> None:
+    api = make_api(lambda _: httpx.Response(200, json=[sample_lyrics]))
+
+    result = asyncio.run(api.search_lyrics(query="test_query"))
+
+    assert result == SearchResult([LyricsMinimal.from_dict(sample_lyrics)])
+
+
+def test_search_lyrics_without_query_or_track_name() -> None:
+    api = make_api(lambda _: httpx.Response(200, json=[]))
+
+    with pytest.raises(ValueError):
+        asyncio.run(api.search_lyrics(artist_name="test_artist_name"))
+
+
+@pytest.mark.parametrize(
+    "status_code, error",
+    [(404, NotFoundError), (429, RateLimitError), (500, ServerError)],
+)
+def test_errors(status_code: int, error: type) -> None:
+    api = make_api(lambda _: httpx.Response(status_code))
+
+    with pytest.raises(error):
+        asyncio.run(api.get_lyrics_by_id(123))
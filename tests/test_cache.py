@@ -0,0 +1,26 @@
+""" Tests for the in-memory cache. """
+
+from lrclib.cache import LRUCache
+
+
+def test_lru_eviction() -> None:
+    cache: LRUCache[int] = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # touch "a" so "b" becomes the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_disabled_cache() -> None:
+    cache: LRUCache[int] = LRUCache(0)
+    cache.set("a", 1)
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
@@ -1,6 +1,13 @@
 import random
 import string
+import sys
+import threading
+from unittest.mock import Mock
 
+import pytest
+
+import lrclib
+from lrclib import cryptographic_challenge_solver
 from lrclib.cryptographic_challenge_solver import (
     CryptoChallengeSolver,
     Solution,
@@ -11,23 +18,104 @@ from lrclib.cryptographic_challenge_solver import (
 easy_target_hex = (
     "0000FFF000000000000000000000000000000000000000000000000000000000"
 )
+easy_target = bytes.fromhex(easy_target_hex)
+# about 1 in 256 digests beat it, enough to run the search loop a few times
+quick_target_hex = (
+    "00FF000000000000000000000000000000000000000000000000000000000000"
+)
+quick_target = bytes.fromhex(quick_target_hex)
 
 
-# generate a random prefixes
-def random_prefix() -> str:
-    return "".join(random.choice(string.ascii_letters) for _ in range(10))
+# generate a random prefix, each test passes its own seed so every run
+# searches the same prefixes whatever tests ran before
+def random_prefix(seed: int) -> str:
+    rng = random.Random(seed)
+    return "".join(rng.choice(string.ascii_letters) for _ in range(10))
 
 
 def test_find_nonce() -> None:
-    prefix = random_prefix()
-    target_hex = easy_target_hex
-    nonce = find_nonce(prefix, bytes.fromhex(target_hex))
+    prefix = random_prefix(1)
+    nonce = find_nonce(prefix, quick_target)
     assert isinstance(nonce, Solution)
-    assert is_nonce_valid(prefix, nonce.nonce, bytes.fromhex(target_hex))
+    assert nonce.target == quick_target
+    assert nonce.target_hex == quick_target_hex.lower()
+    assert is_nonce_valid(prefix, nonce.nonce, quick_target)
 
 
 def test_solve_random() -> None:
-    prefix = random_prefix()
-    target_hex = easy_target_hex
-    nonce = CryptoChallengeSolver.solve(prefix, target_hex, 4)
-    assert is_nonce_valid(prefix, nonce, bytes.fromhex(target_hex))
+    prefix = random_prefix(2)
+    nonce = CryptoChallengeSolver.solve(prefix, easy_target_hex, 4)
+    assert is_nonce_valid(prefix, nonce, easy_target)
+
+
+def test_solve_numba() -> None:
+    pytest.importorskip("numba")
+    prefix = random_prefix(3)
+    nonce = CryptoChallengeSolver.solve(
+        prefix, easy_target_hex, 4, use_numba=True
+    )
+    assert is_nonce_valid(prefix, nonce, easy_target)
+
+
+def test_solve_numba_not_installed(monkeypatch: pytest.MonkeyPatch) -> None:
+    # a None entry makes importing the module raise ImportError
+    monkeypatch.setitem(sys.modules, "lrclib._pow_numba", None)
+    monkeypatch.delattr(lrclib, "_pow_numba", raising=False)
+    with pytest.raises(ImportError):
+        CryptoChallengeSolver.solve(
+            random_prefix(4), easy_target_hex, 4, use_numba=True
+        )
+
+
+def test_find_nonce_numba() -> None:
+    pytest.importorskip("numba")
+    from lrclib._pow_numba import find_nonce_nb
+
+    # tails that fit one block, need a second block, and exceed a block
+    for length in (10, 55, 62, 64, 130):
+        prefix = random_prefix(length) * (length // 10 + 1)
+        prefix = prefix[:length]
+        nonce = find_nonce_nb(prefix.encode(), quick_target)
+        assert nonce == find_nonce(prefix, quick_target).nonce
+
+
+def test_find_nonce_stop_event() -> None:
+    stop_event = threading.Event()
+    stop_event.set()
+    # an unreachable target, the search only ends through the stop event
+    solution = find_nonce(random_prefix(6), bytes(32), stop_event=stop_event)
+    assert not solution.is_solved
+
+
+def test_find_nonce_shared_solution() -> None:
+    prefix = random_prefix(7)
+    solution = Solution(prefix, easy_target)
+    # an unreachable target, the search only ends once the sibling below
+    # solves the shared solution
+    sibling = threading.Thread(
+        target=find_nonce,
+        args=(prefix, bytes(32), solution, 1, 2),
+        daemon=True,
+    )
+    sibling.start()
+    find_nonce(prefix, easy_target, solution, 0, 2)
+    sibling.join(timeout=10)
+
+    assert not sibling.is_alive()
+    assert solution.nonce is not None and solution.nonce % 2 == 0
+    assert is_nonce_valid(prefix, solution.nonce, easy_target)
+
+
+def test_solve_without_fork(monkeypatch: pytest.MonkeyPatch) -> None:
+    # spawned workers would run the calling script again, search in process
+    monkeypatch.setattr(
+        cryptographic_challenge_solver, "_forks_workers", lambda: False
+    )
+    monkeypatch.setattr(
+        cryptographic_challenge_solver,
+        "ProcessPoolExecutor",
+        Mock(side_effect=AssertionError("no worker processes expected")),
+    )
+    prefix = random_prefix(8)
+    nonce = CryptoChallengeSolver.solve(prefix, easy_target_hex, 4)
+    assert is_nonce_valid(prefix, nonce, easy_target)
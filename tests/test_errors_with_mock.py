@@ -1,10 +1,15 @@
-from unittest.mock import Mock
+import json
+import sys
 import warnings
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import Mock
 
 import pytest
-from requests import HTTPError, Response
+from requests import HTTPError, JSONDecodeError, Response, Session
 
-from lrclib.api import BASE_URL, ENDPOINTS, LrcLibAPI
+import lrclib.api
+from lrclib.api import BASE_URL, POOL_SIZE, RETRY, LrcLibAPI
 from lrclib.exceptions import (
     APIError,
     IncorrectPublishTokenError,
@@ -12,76 +17,57 @@ from lrclib.exceptions import (
     RateLimitError,
     ServerError,
 )
-from lrclib.models import (
-    Lyrics,
-    LyricsMinimal,
-    SearchResult,
-    CryptographicChallenge,
+from lrclib.models import SearchResult
+
+
+@pytest.fixture
+def mock_session_with_status(
+    mock_session: Callable[..., Mock]
+) -> Callable[[int], Mock]:
+    # make the api session fail every request with the given status code
+    def _make(status_code: int) -> Mock:
+        mock_error = HTTPError(response=Response())
+        mock_error.response.status_code = status_code
+        return mock_session(side_effect=mock_error)
+
+    return _make
+
+
+@pytest.mark.parametrize(
+    "status_code, error, method, args, kwargs",
+    [
+        (
+            404,
+            NotFoundError,
+            "get_lyrics",
+            ("test_track_name", "test_artist_name", "test_album_name", 180),
+            {},
+        ),
+        (429, RateLimitError, "search_lyrics", (), {"query": "test_query"}),
+        (500, ServerError, "get_lyrics_by_id", (123,), {}),
+        (403, APIError, "get_lyrics_by_id", (123,), {}),
+    ],
 )
-
-
-@pytest.fixture(scope="module")
-def api() -> LrcLibAPI:
-    # Create an instance of the LrcLibAPI class
-    _api = LrcLibAPI(user_agent="test_user_agent")
-    # mock = Mock()
-    # api.session = mock
-    return _api
-
-
-def test_not_found_error(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
-    session_mock.request.side_effect = NotFoundError(Mock(status_code=404))
-
-    # Set the session object of the LrcLibAPI instance to the mock object
-    api.session = session_mock
-
-    # Call the get_lyrics method and check that it raises a NotFoundError
-    with pytest.raises(NotFoundError):
-        api.get_lyrics(
-            "test_track_name", "test_artist_name", "test_album_name", 180
-        )
-
-
-def test_rate_limit_error(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
-    mock_error = HTTPError(response=Response())
-    mock_error.response.status_code = 429
-    session_mock.request.side_effect = mock_error
-
-    # Set the session object of the LrcLibAPI instance to the mock object
-    api.session = session_mock
-
-    # Call the search_lyrics method and check that it raises a RateLimitError
-    with pytest.raises(RateLimitError):
-        api.search_lyrics(query="test_query")
-
-
-def test_server_error(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
-    mock_error = HTTPError(response=Response())
-    mock_error.response.status_code = 500
-    session_mock.request.side_effect = mock_error
-
-    # Set the session object of the LrcLibAPI instance to the mock object
-    api.session = session_mock
-
-    # Call the get_lyrics_by_id method and check that it raises a ServerError
-    with pytest.raises(ServerError):
-        api.get_lyrics_by_id(123)
-
-
-def test_incorrect_publish_token_error(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
-    mock_error = HTTPError(response=Response())
-    mock_error.response.status_code = 400
-    session_mock.request.side_effect = mock_error
-    # Set the session object of the LrcLibAPI instance to the mock object
-    api.session = session_mock
+def test_errors(  # pylint: disable=too-many-arguments
+    api: LrcLibAPI,
+    mock_session_with_status: Callable[[int], Mock],
+    status_code: int,
+    error: type,
+    method: str,
+    args: tuple,
+    kwargs: dict,
+) -> None:
+    mock_session_with_status(status_code)
+
+    # Call the method and check that it raises the matching error
+    with pytest.raises(error):
+        getattr(api, method)(*args, **kwargs)
+
+
+def test_incorrect_publish_token_error(
+    api: LrcLibAPI, mock_session_with_status: Callable[[int], Mock]
+) -> None:
+    mock_session_with_status(400)
 
     with pytest.raises(IncorrectPublishTokenError):
         api.publish_lyrics(
@@ -95,21 +81,6 @@ def test_incorrect_publish_token_error(api: LrcLibAPI) -> None:
         )
 
 
-def test_api_error(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
-    mock_error = HTTPError(response=Response())
-    mock_error.response.status_code = 403
-    session_mock.request.side_effect = mock_error
-
-    # Set the session object of the LrcLibAPI instance to the mock object
-    api.session = session_mock
-
-    # Call the request_challenge method and check that it raises an APIError
-    with pytest.raises(APIError):
-        api.get_lyrics_by_id(123)
-
-
 # test if warning is raised when user agent is not set
 def test_no_user_agent_warning() -> None:
     with pytest.warns(UserWarning, match="user_agent") as record:
@@ -124,6 +95,78 @@ def test_user_agent_no_warning() -> None:
     assert len(record) == 0
 
 
+# test if the default session is mounted with a pooled, retrying adapter
+def test_default_session_adapter() -> None:
+    _api = LrcLibAPI(user_agent="test_user_agent")
+    adapter = _api.session.get_adapter(BASE_URL)
+    assert adapter is _api.session.get_adapter("http://lrclib.net")
+    assert adapter._pool_maxsize == POOL_SIZE  # type: ignore
+    assert adapter.max_retries is RETRY  # type: ignore
+
+
+# test that only idempotent requests are retried on gateway errors
+def test_retry_skips_post() -> None:
+    assert RETRY.is_retry("GET", 503)
+    assert not RETRY.is_retry("POST", 503)
+
+
+# test if a user provided session is left untouched
+def test_custom_session_untouched() -> None:
+    session = Session()
+    adapter = session.get_adapter(BASE_URL)
+    _api = LrcLibAPI(user_agent="test_user_agent", session=session)
+    assert _api.session is session
+    assert _api.session.get_adapter(BASE_URL) is adapter
+
+
+# test if GET responses are cached on disk when cache_path is set
+def test_cache_path_session(tmp_path: Path) -> None:
+    requests_cache = pytest.importorskip("requests_cache")
+    _api = LrcLibAPI(
+        user_agent="test_user_agent", cache_path=str(tmp_path / "cache")
+    )
+    assert isinstance(_api.session, requests_cache.CachedSession)
+    assert _api.session.settings.allowable_methods == ("GET",)
+    assert _api.session.get_adapter(BASE_URL).max_retries is RETRY
+
+
+# test raise ImportError when cache_path is set without requests-cache
+def test_cache_path_not_installed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(sys.modules, "requests_cache", None)
+    with pytest.raises(ImportError):
+        LrcLibAPI(
+            user_agent="test_user_agent", cache_path=str(tmp_path / "cache")
+        )
+
+
+# test raise ImportError when http2 is set without httpx
+def test_http2_not_installed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "httpx", None)
+    with pytest.raises(ImportError):
+        LrcLibAPI(user_agent="test_user_agent", http2=True)
+
+
+# test raise ValueError when the on-disk cache is combined with http2
+def test_cache_path_with_http2(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        LrcLibAPI(
+            user_agent="test_user_agent",
+            cache_path=str(tmp_path / "cache"),
+            http2=True,
+        )
+
+
+# test raise ValueError when http2 or cache_path is combined with a session
+@pytest.mark.parametrize(
+    "kwargs", [{"http2": True}, {"cache_path": "lrclib_cache"}]
+)
+def test_session_with_http2_or_cache_path(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        LrcLibAPI(user_agent="test_user_agent", session=Session(), **kwargs)
+
+
 # test raise ValueError when search_lyrics is called without query or track_name
 def test_invalid_search_lyrics(api: LrcLibAPI) -> None:
     with pytest.raises(ValueError):
@@ -134,31 +177,48 @@ def test_invalid_search_lyrics(api: LrcLibAPI) -> None:
 
 
 # check if search result is empty when 404 is returned
-def test_search_lyrics_empty(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
-    mock_error = HTTPError(response=Response())
-    mock_error.response.status_code = 404
-    session_mock.request.side_effect = mock_error
-
-    # Set the session object of the LrcLibAPI instance to the mock object
-    api.session = session_mock
+def test_search_lyrics_empty(
+    api: LrcLibAPI, mock_session_with_status: Callable[[int], Mock]
+) -> None:
+    mock_session_with_status(404)
 
     # Call the search_lyrics method and check that it returns an empty list
     assert api.search_lyrics(query="test_query") == SearchResult([])
 
 
 # check if error is raised when request_challenge is called and 500 is returned
-def test_request_challenge_500(api: LrcLibAPI) -> None:
-    # Mock the requests.Session object
-    session_mock = Mock()
-    mock_error = HTTPError(response=Response())
-    mock_error.response.status_code = 500
-    session_mock.request.side_effect = mock_error
-
-    # Set the session object of the LrcLibAPI instance to the mock object
-    api.session = session_mock
+def test_request_challenge_500(
+    api: LrcLibAPI, mock_session_with_status: Callable[[int], Mock]
+) -> None:
+    mock_session_with_status(500)
 
     # Call the request_challenge method and check that it raises a ServerError
     with pytest.raises(ServerError):
-        api.request_challenge()
\ No newline at end of file
+        api.request_challenge()
+
+
+def test_error_response_attributes() -> None:
+    response = Mock(status_code=500, reason="Internal Server Error")
+    error = ServerError(response)
+
+    assert error.response is response
+    # the body is only read when asked for
+    assert "text" not in error.__dict__
+    assert error.text is response.text
+    assert error.headers is response.headers
+
+
+# test raise requests.JSONDecodeError on a malformed body, whichever decoder
+@pytest.mark.parametrize("loads", [lrclib.api._json_loads, json.loads])
+def test_malformed_json(
+    api: LrcLibAPI,
+    mock_session: Callable[..., Mock],
+    monkeypatch: pytest.MonkeyPatch,
+    loads: Callable[[bytes], Any],
+) -> None:
+    monkeypatch.setattr(lrclib.api, "_json_loads", loads)
+    session_mock = mock_session()
+    session_mock.request.return_value.content = b"<html>"
+
+    with pytest.raises(JSONDecodeError):
+        api.get_lyrics_by_id(123)
@@ -1,6 +1,9 @@
 """ Tests for the API models. """
 
+from dataclasses import asdict
 from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from lrclib.models import (
     Lyrics,
@@ -10,28 +13,35 @@ from lrclib.models import (
     CryptographicChallenge,
 )
 
-minimal_lyrics = {
-    "id": 123,
-    "name": "test_name",
-    "trackName": "test_track_name",
-    "artistName": "test_artist_name",
-    "albumName": "test_album_name",
-    "duration": 180,
-    "instrumental": False,
-    "plainLyrics": "test_plain_lyrics",
-    "syncedLyrics": "test_synced_lyrics",
-}
-
-full_lyrics = {
-    **minimal_lyrics,
-    "lang": "test_lang",
-    "isrc": "test_isrc",
-    "spotifyId": "test_spotify_id",
-    "releaseDate": "2023-08-10T00:00:00Z",
-}
+# read-only, so no test can change what the others compare against
+minimal_lyrics: Mapping[str, Any] = MappingProxyType(
+    {
+        "id": 123,
+        "name": "test_name",
+        "trackName": "test_track_name",
+        "artistName": "test_artist_name",
+        "albumName": "test_album_name",
+        "duration": 180,
+        "instrumental": False,
+        "plainLyrics": "test_plain_lyrics",
+        "syncedLyrics": "test_synced_lyrics",
+    }
+)
+
+full_lyrics: Mapping[str, Any] = MappingProxyType(
+    {
+        **minimal_lyrics,
+        "lang": "test_lang",
+        "isrc": "test_isrc",
+        "spotifyId": "test_spotify_id",
+        "releaseDate": "2023-08-10T00:00:00Z",
+    }
+)
 
 sample_search_result = [minimal_lyrics, minimal_lyrics]
 
+expected_release_date = datetime(2023, 8, 10, 0, 0, 0)
+
 
 def test_lyrics_minimal_from_dict() -> None:
     """Test the LyricsMinimal.from_dict method"""
@@ -70,13 +80,13 @@ def test_lyrics_from_dict() -> None:
     assert lyrics.lang == full_lyrics["lang"]
     assert lyrics.isrc == full_lyrics["isrc"]
     assert lyrics.spotify_id == full_lyrics["spotifyId"]
-    assert lyrics.release_date == datetime(2023, 8, 10, 0, 0, 0)
+    assert lyrics.release_date == expected_release_date
 
 
 def test_lyrics_from_dict_with_proper_release_date() -> None:
     lyrics = Lyrics.from_dict(full_lyrics)
-    lyrics_proper = Lyrics(**lyrics.__dict__)
-    assert lyrics_proper.release_date == datetime(2023, 8, 10, 0, 0, 0)
+    lyrics_proper = Lyrics(**asdict(lyrics))
+    assert lyrics_proper.release_date == expected_release_date
 
 
 def test_error_response_from_dict() -> None: